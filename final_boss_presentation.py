@@ -1,3 +1,7 @@
+import os
+from pathlib import Path
+import shutil
+
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -15,244 +19,490 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Custom CSS for F1-themed dark presentation
-st.markdown("""
-<style>
-    /* Main background */
-    .stApp {
-        background: linear-gradient(180deg, #0d1117 0%, #161b22 100%);
-    }
-    
-    /* Headers */
-    h1, h2, h3 {
-        color: #ffffff !important;
-        font-family: 'Helvetica Neue', sans-serif;
-    }
-    
-    /* Red accent for F1 */
-    .f1-red {
-        color: #ff1801 !important;
-        font-weight: 700;
-    }
-    
-    /* Hero title */
-    .hero-title {
-        font-size: 3.5rem;
-        font-weight: 800;
-        text-align: center;
-        background: linear-gradient(90deg, #ff1801, #ff6b35);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 0;
-        letter-spacing: -0.02em;
-    }
+# Custom CSS for F1-themed dark presentation. The file is read once per process;
+# the <style> tag itself must be re-emitted on every rerun or Streamlit drops it.
+STYLES_PATH = Path("styles.css")
+
+@st.cache_resource
+def load_css():
+    return STYLES_PATH.read_text(encoding="utf-8")
+
+st.markdown(f"<style>\n{load_css()}</style>", unsafe_allow_html=True)
+
+# =============================================================================
+# DATA LOADING & PREPROCESSING
+# =============================================================================
+DATA_PATH = Path("f1_data.csv")
+# Preprocessed snapshot of DATA_PATH; rebuilt whenever the CSV or this script is newer
+PROCESSED_PATH = DATA_PATH.with_suffix(".parquet")
+
+def is_fresh(path, *sources):
+    return path.exists() and all(path.stat().st_mtime >= src.stat().st_mtime for src in sources)
+
+@st.cache_data
+def load_and_process_data():
+    if is_fresh(PROCESSED_PATH, DATA_PATH, Path(__file__)):
+        try:
+            return pd.read_parquet(PROCESSED_PATH, engine="pyarrow")
+        except (OSError, ValueError):
+            # Unreadable snapshot (e.g. left over from an older build); rebuild it from the CSV
+            pass
+    
+    df = pd.read_csv(DATA_PATH)
+    
+    # Date conversions (ISO dates in the CSV; explicit format keeps pandas on the fast path)
+    df["race_date"] = pd.to_datetime(df["race_date"], format="%Y-%m-%d", errors="coerce", cache=True)
+    df["driver_dob"] = pd.to_datetime(df["driver_dob"], format="%Y-%m-%d", errors="coerce", cache=True)
+    
+    # Age calculation: one pass over the raw int64 nanosecond buffers (NaT masked afterwards)
+    race_ns = df["race_date"].to_numpy(dtype="datetime64[ns]").view("i8")
+    dob_ns = df["driver_dob"].to_numpy(dtype="datetime64[ns]").view("i8")
+    df["age_years"] = (race_ns - dob_ns) * (1.0 / (365.25 * 86_400 * 1_000_000_000))
+    df.loc[df["race_date"].isna() | df["driver_dob"].isna(), "age_years"] = np.nan
+    
+    # Status is low-cardinality (~140 distinct values): classify each distinct status once,
+    # then broadcast to rows through the category codes. Missing statuses have code -1,
+    # which picks the trailing fallback entry of each lookup table.
+    status = df["status"].astype("category")
+    status_codes = status.cat.codes.to_numpy()
+    status_labels = pd.Series(status.cat.categories, dtype="string")
+    
+    # Finished flag: use status-based definition (consistent with earlier analysis).
+    # Kept as a plain 1-byte np.bool_ column so downstream sum/mean are vectorized reductions.
+    finished_lut = (
+        status_labels.eq("Finished") | status_labels.str.startswith("+")
+    ).to_numpy(dtype=np.bool_, na_value=False)
+    df["finished"] = np.append(finished_lut, False)[status_codes]
+    
+    # Status categorization (keyword matching, first match wins)
+    status_lower = status_labels.str.lower()
+    mech_re = "engine|gearbox|hydraulics|electrical|transmission|brake|clutch|suspension|power unit|turbo"
+    accident_re = "accident|collision|spun|crash"
+    category_lut = np.select(
+        [
+            (status_lower.eq("finished") | status_lower.str.startswith("+")).to_numpy(dtype=bool, na_value=False),
+            status_lower.str.contains(mech_re, regex=True).to_numpy(dtype=bool, na_value=False),
+            status_lower.str.contains(accident_re, regex=True).to_numpy(dtype=bool, na_value=False),
+        ],
+        ["Finished", "Mechanical DNF", "Accident"],
+        default="Other DNF"
+    )
+    df["status"] = status
+    df["status_category"] = pd.Categorical(np.append(category_lut, "Other DNF")[status_codes])
     
-    .hero-subtitle {
-        font-size: 1.3rem;
-        text-align: center;
-        color: #8b949e;
-        margin-top: 0.5rem;
-        font-weight: 400;
-    }
+    # Boolean outcome flags, so groupbys use the plain sum/mean kernels instead of lambdas
+    df["is_win"] = df["final_position"].eq(1).to_numpy(dtype=np.bool_, na_value=False)
+    df["is_mech_dnf"] = (df["status_category"] == "Mechanical DNF").to_numpy(dtype=np.bool_)
     
-    /* Metric cards */
-    .metric-card {
-        background: linear-gradient(135deg, #21262d 0%, #161b22 100%);
-        border: 1px solid #30363d;
-        border-radius: 16px;
-        padding: 24px;
-        margin: 10px 0;
-        transition: transform 0.2s, box-shadow 0.2s;
-    }
+    # Position delta (NaN final positions propagate through the subtraction)
+    df["position_delta"] = (
+        df["grid_starting_position"].astype("float32") - df["final_position"].astype("float32")
+    )
     
-    .metric-card:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 8px 25px rgba(255, 24, 1, 0.15);
-    }
+    # Downcast numeric columns: positions fit in int8 (nullable where DNFs leave gaps),
+    # years in int16, points and derived measures in float32 (well within display precision)
+    df = df.astype({
+        "grid_starting_position": "int8",
+        "final_position": "Int8",
+        "year": "int16",
+        "age_years": "float32",
+        "position_delta": "float32",
+        "points": "float32",
+    })
     
-    .metric-value {
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: #ff1801;
-        margin: 0;
-    }
+    # Low-cardinality labels as categoricals (smaller snapshot, faster groupbys/merges)
+    for col in ("circuit_name", "driver", "race_name", "constructor_name", "driver_nationality"):
+        df[col] = df[col].astype("category")
     
-    .metric-label {
-        font-size: 0.9rem;
-        color: #8b949e;
-        text-transform: uppercase;
-        letter-spacing: 0.1em;
-        margin-top: 8px;
-    }
+    try:
+        # Write beside the snapshot and swap it in, so a crash mid-write can't leave a truncated file
+        tmp_path = PROCESSED_PATH.with_suffix(".parquet.tmp")
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+        os.replace(tmp_path, PROCESSED_PATH)
+    except OSError:
+        # Read-only deployments just skip the snapshot and reparse next cold start
+        pass
     
-    /* Section headers */
-    .section-header {
-        font-size: 2rem;
-        font-weight: 700;
-        color: #ffffff;
-        border-left: 4px solid #ff1801;
-        padding-left: 20px;
-        margin: 40px 0 20px 0;
-    }
+    return df
+
+df = load_and_process_data()
+
+# =============================================================================
+# CACHED ANALYTICS
+# =============================================================================
+# Cheap cache key for a frame: shape, columns and a strided ~1000-row sample (index
+# included, since aggregates keep their labels there), instead of hashing every cell
+def frame_fingerprint(d):
+    sample = d.iloc[::max(1, len(d) // 1000)]
+    return (d.shape, tuple(d.columns), int(pd.util.hash_pandas_object(sample).sum()))
+
+cache_frame = st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: frame_fingerprint})
+
+# Circuit difficulty table plus the filtered/ranked views used in RQ1
+@cache_frame
+def build_circuit_stats(df):
+    # Single pass over int codes + bools (per-circuit race counts aren't shown anywhere)
+    grp = df.groupby("circuit_name", observed=True)
+    circuit_stats = pd.DataFrame({
+        "entries": grp.size(),
+        "dnf_rate": 1.0 - grp["finished"].mean()
+    })
     
-    /* Research question box */
-    .rq-box {
-        background: linear-gradient(135deg, #1a1f29 0%, #0d1117 100%);
-        border: 1px solid #ff1801;
-        border-radius: 12px;
-        padding: 20px 24px;
-        margin: 20px 0;
-    }
+    # Difficulty tiers (33rd/66th percentile cut points, right-inclusive)
+    circuit_stats["difficulty"] = pd.qcut(
+        circuit_stats["dnf_rate"],
+        q=[0, 0.33, 0.66, 1.0],
+        labels=["Easy", "Medium", "Hard"]
+    )
     
-    .rq-label {
-        color: #ff1801;
-        font-weight: 600;
-        font-size: 0.85rem;
-        letter-spacing: 0.15em;
-        margin-bottom: 8px;
-    }
+    # Filter to circuits with ≥500 entries for statistical significance
+    # (matching methodology from earlier analysis)
+    big_circuits = circuit_stats[circuit_stats["entries"] >= 500].copy()
+    # Top/bottom 10 from a single partial sort, already in bar-chart order (bars are drawn bottom-up)
+    rates = big_circuits["dnf_rate"].to_numpy()
+    n, k = len(rates), min(10, len(rates))
+    idx = np.argpartition(rates, (k - 1, n - k))
+    top_hard = big_circuits.iloc[idx[n - k:]].sort_values("dnf_rate").reset_index()
+    top_easy = big_circuits.iloc[idx[:k]].sort_values("dnf_rate", ascending=False).reset_index()
+    
+    return circuit_stats, big_circuits, top_hard, top_easy
+
+circuit_stats, big_circuits, top_hard, top_easy = build_circuit_stats(df)
+
+# Add circuit difficulty to main df once, before any tab aggregates by it
+# (per-circuit lookup, no merge; keeps the ordered Easy/Medium/Hard categorical)
+df["dnf_rate"] = df["circuit_name"].map(circuit_stats["dnf_rate"]).astype(float)
+df["difficulty"] = df["circuit_name"].map(circuit_stats["difficulty"]).astype(circuit_stats["difficulty"].dtype)
+
+# Left-closed age bin edges, same dtype as age_years
+AGE_BINS = np.array([18, 22, 25, 30, 35, 40, 100], dtype=np.float32)
+AGE_LABELS = ["18–22", "22–25", "25–30", "30–35", "35–40", "40+"]
+# Minimum races per difficulty tier for a driver to count as a hard-track candidate
+MIN_RACES_PER_TIER = 10
+# Final Boss Score weights (must sum to 1; mirrored in the RQ4 "Score Composition" text)
+FINAL_BOSS_WEIGHTS = {
+    "points_per_race": 0.30,     # overall performance
+    "finish_rate": 0.20,         # consistency/reliability
+    "avg_position_delta": 0.20,  # racecraft
+    "ppr_hard": 0.30,            # performance under pressure
+}
+
+# RQ2 age curve
+def compute_age_perf(df):
+    # Bin codes straight from np.digitize; ages outside [18, 100) and missing ages get
+    # code -1 (NaN), as pd.cut(..., right=False) would give
+    codes = np.digitize(df["age_years"].to_numpy(), AGE_BINS) - 1
+    codes[(codes < 0) | (codes >= len(AGE_LABELS))] = -1
+    age_bin = pd.Series(
+        pd.Categorical.from_codes(codes, categories=AGE_LABELS, ordered=True),
+        index=df.index, name="age_bin"
+    )
+    # Row counts come from grp.size() (no per-column null check, every row counts)
+    grp = df.groupby(age_bin, observed=True)
+    age_perf = grp.agg(
+        avg_points=("points", "mean"),
+        finish_rate=("finished", "mean"),
+        wins=("is_win", "sum")
+    )
+    age_perf.insert(0, "races", grp.size())
+    age_perf["win_rate"] = age_perf["wins"] / age_perf["races"] * 100
+    return age_perf
+
+# RQ2 per-driver career summary, plus the 50+ race subset used for rankings
+def compute_driver_summary(df):
+    grp = df.groupby("driver", observed=True)
+    driver_summary = grp.agg(
+        points_per_race=("points", "mean"),
+        avg_position_delta=("position_delta", "mean"),
+        finish_rate=("finished", "mean"),
+        wins=("is_win", "sum")
+    )
+    driver_summary.insert(0, "races", grp.size())
+    driver_summary["win_rate"] = driver_summary["wins"] / driver_summary["races"]
     
-    .rq-text {
-        color: #e6edf3;
-        font-size: 1.1rem;
-        font-style: italic;
-    }
+    experienced = driver_summary[driver_summary["races"] >= 50]
+    return driver_summary, experienced
+
+# Top-n rows by `col`, in DataFrame.nlargest(n, col) order (descending, ties keep the
+# first occurrence, NaNs skipped), but selected with a linear-time partition
+def top_n(frame, col, n=10):
+    values = frame[col].to_numpy(dtype=np.float64)
+    pos = np.flatnonzero(~np.isnan(values))
+    if len(pos) > n:
+        cutoff = np.partition(values[pos], len(pos) - n)[len(pos) - n]
+        pos = pos[values[pos] >= cutoff]
+    order = np.lexsort((pos, -values[pos]))[:n]
+    return frame.iloc[pos[order]]
+
+# Entries and PPR per difficulty tier (one column per tier) for every `key` value, as a
+# (races, ppr) pair of frames. Counts and point sums are accumulated straight into
+# (key x tier) matrices indexed by the categorical codes, bypassing the groupby/unstack
+# machinery; PPR is NaN for tiers with no races.
+def tier_stats(df, key):
+    key_labels = df[key].cat.categories
+    tier_labels = df["difficulty"].cat.categories
+    key_codes = df[key].cat.codes.to_numpy()
+    tier_codes = df["difficulty"].cat.codes.to_numpy()
+    valid = (key_codes >= 0) & (tier_codes >= 0)
+    
+    cells = key_codes[valid].astype(np.intp) * len(tier_labels) + tier_codes[valid]
+    shape = (len(key_labels), len(tier_labels))
+    races = np.bincount(cells, minlength=shape[0] * shape[1]).reshape(shape)
+    points = np.bincount(
+        cells, weights=df["points"].to_numpy()[valid], minlength=shape[0] * shape[1]
+    ).reshape(shape)
+    
+    with np.errstate(invalid="ignore"):
+        ppr = points / races
+    
+    index = pd.Index(key_labels, name=key)
+    return (
+        pd.DataFrame(races, columns=tier_labels, index=index),
+        pd.DataFrame(ppr, columns=tier_labels, index=index)
+    )
+
+# Per-tier PPR for every key value with at least `min_races` entries on both Easy and
+# Hard circuits
+def easy_hard_ppr(tiers, min_races):
+    races, ppr = tiers
+    return ppr[(races["Easy"] >= min_races) & (races["Hard"] >= min_races)]
+
+# RQ2 Easy vs Hard circuit PPR for drivers with enough races on both tiers
+# (10+ for statistical significance; this matches the notebook methodology)
+def compute_driver_easy_hard(driver_tiers):
+    driver_easy_hard = easy_hard_ppr(driver_tiers, MIN_RACES_PER_TIER)
+    driver_easy_hard["hard_ratio"] = driver_easy_hard["Hard"] / driver_easy_hard["Easy"]
+    return driver_easy_hard
+
+# RQ2/H4 nationality summary with points normalized by constructor-season average
+def compute_nationality_summary(df):
+    # Calculate constructor PPR per season (mean = points sum / entries, in one pass)
+    season_ppr = df.groupby(["year", "constructor_name"], observed=True)["points"].mean()
+    
+    # Look each entry's (year, constructor) up in the aggregated index (no merge), on a
+    # narrow projection of df holding only the columns aggregated below
+    season_key = pd.MultiIndex.from_arrays([df["year"], df["constructor_name"]])
+    df_nat = df[["points", "driver_nationality", "race_name", "driver", "finished"]].assign(
+        constructor_ppr=season_ppr.reindex(season_key).to_numpy()
+    )
     
-    /* Finding box */
-    .finding-box {
-        background: linear-gradient(135deg, #0d2818 0%, #0d1117 100%);
-        border: 1px solid #238636;
-        border-radius: 12px;
-        padding: 20px 24px;
-        margin: 20px 0;
-    }
+    # Normalized points: driver points compared to their constructor's average
+    # (NaN where the constructor scored nothing that season)
+    constructor_ppr = df_nat["constructor_ppr"].to_numpy()
+    df_nat["normalized_points"] = np.divide(
+        df_nat["points"].to_numpy(), constructor_ppr,
+        out=np.full(len(df_nat), np.nan),
+        where=constructor_ppr > 0
+    )
     
-    .finding-label {
-        color: #3fb950;
-        font-weight: 600;
-        font-size: 0.85rem;
-        margin-bottom: 8px;
-    }
+    # Aggregate by nationality
+    grp = df_nat.groupby("driver_nationality", observed=True)
+    nationality_summary = grp.agg(
+        drivers=("driver", "nunique"),
+        avg_points=("points", "mean"),
+        avg_normalized_points=("normalized_points", "mean"),
+        finish_rate=("finished", "mean")
+    )
+    nationality_summary.insert(0, "races", grp.size())
     
-    /* Driver card */
-    .driver-card {
-        background: linear-gradient(135deg, #21262d 0%, #161b22 100%);
-        border: 2px solid #ff1801;
-        border-radius: 16px;
-        padding: 30px;
-        text-align: center;
-    }
+    # Filter to nationalities with 100+ races
+    nationality_filtered = nationality_summary[nationality_summary["races"] >= 100]
+    return nationality_filtered.sort_values("avg_normalized_points", ascending=False)
+
+# RQ3 per-constructor summary and 'Tank with Teeth' score for 100+ race constructors
+def compute_constructor_summary(df):
+    grp = df.groupby("constructor_name", observed=True)
+    constructor_summary = grp.agg(
+        points_per_race=("points", "mean"),
+        finish_rate=("finished", "mean"),
+        mech_dnf_rate=("is_mech_dnf", "mean"),
+        wins=("is_win", "sum")
+    )
+    constructor_summary.insert(0, "races", grp.size())
     
-    .driver-name {
-        font-size: 2rem;
-        font-weight: 700;
-        color: #ffffff;
-        margin-bottom: 10px;
-    }
+    # eval returns a new frame, so the filtered slice needs no defensive copy
+    major_constructors = constructor_summary[constructor_summary["races"] >= 100].eval(
+        "tank_score = points_per_race * finish_rate"
+    )
+    return constructor_summary, major_constructors
+
+# RQ3 Easy vs Hard circuit PPR for constructors with 50+ races on both tiers
+def compute_constructor_easy_hard(df):
+    constructor_easy_hard = easy_hard_ppr(tier_stats(df, "constructor_name"), 50)
+    constructor_easy_hard["hard_specialist_score"] = constructor_easy_hard["Hard"] / constructor_easy_hard["Easy"]
+    return constructor_easy_hard
+
+# RQ4 Final Boss scoring over 50+ race drivers with a valid hard-track PPR
+def compute_final_boss(driver_summary, driver_tiers):
     
-    .driver-score {
-        font-size: 3rem;
-        font-weight: 800;
-        background: linear-gradient(90deg, #ff1801, #ff6b35);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-    }
+    # Hard track PPR for drivers with 10+ races on Hard circuits, read off the per-tier
+    # tables shared with the RQ2 Easy vs Hard analysis (no extra groupby)
+    races, ppr = driver_tiers
+    ppr_hard = ppr["Hard"][races["Hard"] >= MIN_RACES_PER_TIER].rename("ppr_hard")
     
-    /* Tab styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-        background-color: #161b22;
-        padding: 10px;
-        border-radius: 12px;
-    }
+    # Both frames are indexed by driver, so this is an index join (no reset + merge)
+    driver_summary = driver_summary.join(ppr_hard)
     
-    .stTabs [data-baseweb="tab"] {
-        background-color: #21262d;
-        border-radius: 8px;
-        color: #8b949e;
-        padding: 10px 20px;
-    }
+    # Filter candidates: 50+ races AND has valid hard track PPR
+    candidates = driver_summary[
+        (driver_summary["races"] >= 50) & 
+        (driver_summary["ppr_hard"].notna())
+    ].copy()
     
-    .stTabs [aria-selected="true"] {
-        background-color: #ff1801 !important;
-        color: white !important;
-    }
+    # Min-max normalize each metric and take the weighted sum, all in one (n x 4) matrix
+    metrics = candidates[list(FINAL_BOSS_WEIGHTS)].to_numpy(dtype=np.float64)
+    lo, hi = metrics.min(axis=0), metrics.max(axis=0)
+    candidates["final_boss_score"] = (
+        (metrics - lo) / (hi - lo + 1e-10) @ np.fromiter(FINAL_BOSS_WEIGHTS.values(), dtype=np.float64)
+    )
     
-    /* Hide streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    
-    /* Progress indicator */
-    .progress-dot {
-        display: inline-block;
-        width: 12px;
-        height: 12px;
-        border-radius: 50%;
-        margin: 0 6px;
-        background: #30363d;
+    return top_n(candidates, "final_boss_score", 15)
+
+# Every RQ2-RQ4 table in one pass
+def compute_analytics(df):
+    driver_summary, experienced = compute_driver_summary(df)
+    driver_tiers = tier_stats(df, "driver")
+    driver_easy_hard = compute_driver_easy_hard(driver_tiers)
+    constructor_summary, major_constructors = compute_constructor_summary(df)
+    constructor_easy_hard = compute_constructor_easy_hard(df)
+    # Ratio only for drivers with non-trivial Easy PPR, to avoid inf
+    valid_ratio = driver_easy_hard[driver_easy_hard["Easy"] > 0.1]
+    return {
+        "age_perf": compute_age_perf(df),
+        "driver_summary": driver_summary,
+        "experienced": experienced,
+        "top_ppr": top_n(experienced, "points_per_race"),
+        "top_finish": top_n(experienced, "finish_rate"),
+        "driver_easy_hard": driver_easy_hard,
+        "top_hard_drivers": top_n(driver_easy_hard, "Hard"),
+        "top_specialists": top_n(valid_ratio, "hard_ratio"),
+        "nationality_filtered": compute_nationality_summary(df),
+        "constructor_summary": constructor_summary,
+        "major_constructors": major_constructors,
+        "top_tank": top_n(major_constructors, "tank_score"),
+        "constructor_easy_hard": constructor_easy_hard,
+        "top_hard_const": top_n(constructor_easy_hard, "Hard"),
+        "top_specialist_const": top_n(constructor_easy_hard, "hard_specialist_score"),
+        "top_15": compute_final_boss(driver_summary, driver_tiers),
     }
-    
-    .progress-dot.active {
-        background: #ff1801;
+
+# Key-finding texts for the RQ2/RQ3 tabs, formatted once from the analytics tables so the
+# render path does no pandas indexing
+def compute_findings(analytics):
+    age_perf = analytics["age_perf"]
+    prime_age = age_perf.loc[age_perf["win_rate"].idxmax()]
+    best_hard = analytics["top_hard_drivers"].iloc[0]
+    driver_easy_hard = analytics["driver_easy_hard"]
+    drivers_above_90pct = int((driver_easy_hard["hard_ratio"] >= 0.9).sum())
+    nationality_filtered = analytics["nationality_filtered"]
+    best = analytics["top_tank"].iloc[0]
+    best_hard_constructor = analytics["top_hard_const"].iloc[0]
+    return {
+        "H1": (
+            f"<b>H1 VALIDATED:</b> The prime performance window is <b>{prime_age.name}</b> with "
+            f"a <b>{prime_age['win_rate']:.1f}%</b> win rate and <b>{int(prime_age['wins'])}</b> total victories. "
+            f"This is when experience meets physical prime."
+        ),
+        "H2": (
+            f"<b>H2 VALIDATED:</b> <b>{best_hard.name}</b> leads hard circuit performance with "
+            f"<b>{best_hard['Hard']:.2f}</b> PPR. <b>{drivers_above_90pct}</b> drivers maintain ≥90% of their "
+            f"easy-track performance on hard tracks. True legends don't just survive hard tracks, they maintain dominance."
+        ),
+        "H3_part1": (
+            f"<b>H3 VALIDATED (Part 1):</b> <b>{best.name}</b> is the ultimate 'Tank with Teeth' – "
+            f"combining <b>{best['points_per_race']:.2f}</b> PPR with <b>{best['finish_rate']:.0%}</b> finish rate "
+            f"and only <b>{best['mech_dnf_rate']:.1%}</b> mechanical DNFs. The Final Boss needs a car that finishes AND wins."
+        ),
+        "H3_part2": (
+            f"<b>H3 VALIDATED (Part 2):</b> <b>{best_hard_constructor.name}</b> leads on hard circuits with "
+            f"<b>{best_hard_constructor['Hard']:.2f}</b> PPR. The best constructors balance pace with reliability, "
+            f"especially maintaining performance on difficult circuits."
+        ),
+        "H4": (
+            f"<b>H4 VALIDATED:</b> <b>{nationality_filtered.index[0]}</b> drivers lead with "
+            f"<b>{nationality_filtered.iloc[0]['avg_normalized_points']:.2f}x</b> normalized points "
+            f"(extracting more than expected from their cars). However, nationality is <b>context, not destiny</b> – "
+            f"the Final Boss persona is defined by individual style metrics (racecraft, consistency, hard-track skill), not nationality alone."
+        ),
     }
-    
-    /* Divider */
-    .section-divider {
-        border: none;
-        border-top: 1px solid #30363d;
-        margin: 40px 0;
+
+# Winner, best constructor and runner-ups as plain dicts/records for the RQ3, RQ4 and
+# Conclusion tabs, extracted once so the render path does no pandas row access. The
+# winner's card/metric values are also pre-formatted, as both tabs show them the same way.
+def compute_final_boss_summary(analytics):
+    top_15 = analytics["top_15"]
+    winner = top_15.iloc[0]
+    best = analytics["top_tank"].iloc[0]
+    return {
+        "winner": {"driver": top_15.index[0], **winner.to_dict()},
+        "winner_text": {
+            "races": f"{int(winner['races'])}",
+            "points_per_race": f"{winner['points_per_race']:.2f}",
+            "finish_rate": f"{winner['finish_rate']:.0%}",
+            "avg_position_delta": f"+{winner['avg_position_delta']:.1f}",
+            "final_boss_score": f"{winner['final_boss_score']:.3f}",
+        },
+        "best": {"constructor_name": best.name, **best.to_dict()},
+        "runner_ups": top_15["final_boss_score"].iloc[1:6].reset_index().to_dict("records"),
     }
-</style>
-""", unsafe_allow_html=True)
 
-# =============================================================================
-# DATA LOADING & PREPROCESSING
-# =============================================================================
-@st.cache_data
-def load_and_process_data():
-    df = pd.read_csv("f1_data.csv")
-    
-    # Date conversions
-    df["race_date"] = pd.to_datetime(df["race_date"], errors="coerce")
-    df["driver_dob"] = pd.to_datetime(df["driver_dob"], errors="coerce")
-    
-    # Age calculation
-    df["age_years"] = (df["race_date"] - df["driver_dob"]).dt.days / 365.25
-    
-    # Finished flag: use status-based definition (consistent with earlier analysis)
-    def is_finished(status):
-        if pd.isna(status):
-            return False
-        s = str(status)
-        return s == "Finished" or s.startswith("+")
-    
-    df["finished"] = df["status"].apply(is_finished)
-    
-    # Status categorization
-    def classify_status(status):
-        s = str(status).lower()
-        if s in ["finished"] or s.startswith("+"):
-            return "Finished"
-        mech_keywords = ["engine", "gearbox", "hydraulics", "electrical", "transmission", 
-                        "brake", "clutch", "suspension", "power unit", "turbo"]
-        if any(k in s for k in mech_keywords):
-            return "Mechanical DNF"
-        if any(k in s for k in ["accident", "collision", "spun", "crash"]):
-            return "Accident"
-        return "Other DNF"
-    
-    df["status_category"] = df["status"].apply(classify_status)
-    
-    # Position delta
-    df["position_delta"] = np.where(
-        df["final_position"].notna(),
-        df["grid_starting_position"] - df["final_position"],
-        np.nan
-    )
-    
-    return df
+# On-disk snapshot of the analytics tables, one Parquet file per key; like PROCESSED_PATH
+# it is rebuilt whenever the CSV or this script is newer
+ANALYTICS_DIR = DATA_PATH.with_name("analytics")
+# Tables a complete snapshot holds (mirrors the keys compute_analytics returns)
+ANALYTICS_KEYS = frozenset({
+    "age_perf", "driver_summary", "experienced", "top_ppr", "top_finish",
+    "driver_easy_hard", "top_hard_drivers", "top_specialists", "nationality_filtered",
+    "constructor_summary", "major_constructors", "top_tank", "constructor_easy_hard",
+    "top_hard_const", "top_specialist_const", "top_15",
+})
 
-df = load_and_process_data()
+def load_analytics_snapshot():
+    paths = list(ANALYTICS_DIR.glob("*.parquet"))
+    if {path.stem for path in paths} != ANALYTICS_KEYS:
+        return None
+    if not all(is_fresh(path, DATA_PATH, Path(__file__)) for path in paths):
+        return None
+    try:
+        return {path.stem: pd.read_parquet(path, engine="pyarrow") for path in paths}
+    except (OSError, ValueError):
+        return None
+
+def save_analytics_snapshot(analytics):
+    tmp_dir = ANALYTICS_DIR.with_name("analytics.tmp")
+    old_dir = ANALYTICS_DIR.with_name("analytics.old")
+    try:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir()
+        for key, frame in analytics.items():
+            frame.to_parquet(tmp_dir / f"{key}.parquet", engine="pyarrow", compression="zstd")
+        # Swap the finished directory in, so a failed or interrupted write never leaves
+        # ANALYTICS_DIR holding only some of the tables
+        shutil.rmtree(old_dir, ignore_errors=True)
+        if ANALYTICS_DIR.exists():
+            ANALYTICS_DIR.rename(old_dir)
+        os.replace(tmp_dir, ANALYTICS_DIR)
+        shutil.rmtree(old_dir, ignore_errors=True)
+    except OSError:
+        pass
+
+# Cached so a rerun hashes df once and does no pandas work; a cold start reads the
+# snapshot instead of recomputing the aggregations. Findings are derived from the
+# tables either way (they are strings, so not part of the snapshot).
+@cache_frame
+def build_analytics(df):
+    analytics = load_analytics_snapshot()
+    if analytics is None:
+        analytics = compute_analytics(df)
+        save_analytics_snapshot(analytics)
+    
+    analytics["findings"] = compute_findings(analytics)
+    analytics["final_boss"] = compute_final_boss_summary(analytics)
+    return analytics
+
+analytics = build_analytics(df)
+findings = analytics["findings"]
+final_boss = analytics["final_boss"]
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -265,6 +515,41 @@ def create_metric_card(value, label, prefix="", suffix=""):
     </div>
     """
 
+# Static HTML snippets, defined once at import (left-aligned so they can be joined into
+# larger markdown blocks without being read as indented code)
+DIVIDER_HTML = "<hr class='section-divider'>"
+INSIGHT_HTML = """<div class="rq-box" style="border-color: #ff1801;">
+    <p style="color: #e6edf3; font-size: 1.2rem; line-height: 1.8; margin: 0;">
+        The F1 Final Boss is not the fastest qualifier or the most spectacular overtaker – 
+        they are the <span class="f1-red"><b>complete package</b></span>: experienced enough to read races tactically, 
+        consistent enough to bring the car home, skilled enough to gain positions when needed, 
+        and mentally tough enough to thrive when conditions punish others.
+    </p>
+    <p style="color: #ff1801; font-size: 1.3rem; font-style: italic; margin-top: 20px; margin-bottom: 0;">
+        "When others struggle, the Final Boss excels."
+    </p>
+</div>"""
+FOOTER_HTML = "<br><br><p style='text-align: center; color: #8b949e;'>Thank you for watching! 🏎️</p>"
+
+# Equal-width row of metric cards emitted as one HTML block (one st.markdown call).
+# Cards are stripped so their indented lines aren't parsed as markdown code blocks.
+def create_metric_row(*cards):
+    return '<div class="metric-row">' + "".join(card.strip() for card in cards) + "</div>"
+
+# Runner-up cards (rank, name, score) as one equal-width flex row, so the whole grid is a
+# single st.markdown call instead of st.columns plus one call per card. Takes the plain
+# {"driver", "final_boss_score"} records from final_boss["runner_ups"].
+def create_runner_up_row(runner_ups, first_rank=2):
+    cards = "".join(
+        '<div class="runner-up-card">'
+        f'<p style="color: #8b949e; font-size: 0.75rem; margin: 0;">#{rank}</p>'
+        f'<p style="color: #e6edf3; font-weight: 600; margin: 5px 0;">{runner["driver"]}</p>'
+        f'<p style="color: #ff1801; font-weight: 700; margin: 0;">{runner["final_boss_score"]:.3f}</p>'
+        '</div>'
+        for rank, runner in enumerate(runner_ups, start=first_rank)
+    )
+    return f'<div class="runner-up-row">{cards}</div>'
+
 def create_rq_box(rq_num, question):
     return f"""
     <div class="rq-box">
@@ -292,6 +577,157 @@ plotly_template = {
     }
 }
 
+# Themed base layouts for the recurring chart shapes, merged once at import and passed
+# positionally to update_layout (no per-call dict splat)
+LAYOUT_BASE = plotly_template['layout']
+LAYOUT_HBAR = {**LAYOUT_BASE, "yaxis_title": "", "coloraxis_showscale": False}
+LAYOUT_SCATTER = {**LAYOUT_BASE, "height": 400}
+
+# Charts with no interactivity requirement render as static images (no hover/zoom JS)
+STATIC_CHART_CONFIG = {"staticPlot": True}
+
+# Blank themed figure for low-level (graph_objects) charts. Prefer go.Scattergl over
+# go.Scatter for any trace with more than ~5k points so it renders via WebGL.
+def new_fig(*traces):
+    fig = go.Figure(traces)
+    fig.update_layout(LAYOUT_BASE, uirevision="static")
+    fig.update_traces(marker_line_width=0, selector=dict(type="bar"))
+    return fig
+
+# Horizontal DNF-rate bar chart; keyed on plain tuples so the figure is built once per process
+@st.cache_resource
+def build_dnf_rate_bar_fig(circuit_names, dnf_rates, colors):
+    dnf_rates = np.asarray(dnf_rates)
+    fig = new_fig(go.Bar(
+        x=dnf_rates,
+        y=circuit_names,
+        orientation="h",
+        marker=dict(color=dnf_rates, colorscale=[[0, colors[0]], [1, colors[1]]]),
+    ))
+    fig.update_layout(
+        height=400,
+        showlegend=False,
+        xaxis_title="DNF Rate",
+        yaxis_title="",
+        xaxis_tickformat=".0%"
+    )
+    return fig
+
+# Top-N horizontal bar chart (largest bar on top), labelled by the frame's index. Cached as
+# a plain dict so reruns skip Plotly Express trace construction; rehydrate with
+# go.Figure(...) before plotting.
+@cache_frame
+def build_hbar_fig(frame, x, colors, xaxis_title, height=400, xaxis_tickformat=None,
+                   vline=None, hover_data=None):
+    frame = frame.sort_values(x)
+    fig = px.bar(
+        frame,
+        x=x,
+        y=frame.index,
+        orientation="h",
+        color=x,
+        color_continuous_scale=list(colors),
+        hover_data=list(hover_data) if hover_data else None
+    )
+    fig.update_layout(LAYOUT_HBAR, height=height, xaxis_title=xaxis_title)
+    if xaxis_tickformat:
+        fig.update_layout(xaxis_tickformat=xaxis_tickformat)
+    if vline is not None:
+        fig.add_vline(x=vline, line_dash="dash", line_color="#30363d")
+    return fig.to_dict()
+
+# Plain top-N panel (no reference lines or extra hover fields) as a native Vega-Lite bar
+# chart, a far smaller spec than a Plotly figure. Bars keep the series' top_n order; in
+# horizontal mode x_label names the category axis, so the value title goes in y_label.
+def top_bar_chart(series, value_title, color="#ff1801", height=400):
+    st.bar_chart(
+        series, horizontal=True, sort=False, color=color,
+        x_label="", y_label=value_title, height=height
+    )
+
+# Two bar panels side by side in one figure, so a twin-chart row costs a single Plotly
+# serialization and websocket send. Each panel is a Series drawn against its index and
+# coloured by value; horizontal panels are sorted so the largest bar is on top. Cached
+# as a plain dict like build_hbar_fig.
+@cache_frame
+def build_bar_pair_fig(left, right, titles, value_titles, colors, orientation="h", label_title="",
+                       value_tickformats=(None, None), ref_lines=(None, None), height=400):
+    horizontal = orientation == "h"
+    # Horizontal panels need room between them for the right panel's category labels
+    fig = make_subplots(
+        rows=1, cols=2, subplot_titles=titles, horizontal_spacing=0.2 if horizontal else 0.1
+    )
+    for col, (series, panel_colors, value_title, tickformat, ref_line) in enumerate(
+        zip((left, right), colors, value_titles, value_tickformats, ref_lines), start=1
+    ):
+        if horizontal:
+            series = series.sort_values()
+        labels, values = series.index.to_numpy(), series.to_numpy()
+        fig.add_trace(go.Bar(
+            x=values if horizontal else labels,
+            y=labels if horizontal else values,
+            orientation=orientation,
+            marker=dict(
+                color=values,
+                colorscale=[[i / (len(panel_colors) - 1), c] for i, c in enumerate(panel_colors)]
+            ),
+            hovertemplate="%{y}: %{x}<extra></extra>" if horizontal else "%{x}: %{y}<extra></extra>"
+        ), row=1, col=col)
+        value_axis = dict(title_text=value_title, tickformat=tickformat)
+        label_axis = dict(title_text=label_title)
+        fig.update_xaxes(**(value_axis if horizontal else label_axis), row=1, col=col)
+        fig.update_yaxes(**(label_axis if horizontal else value_axis), row=1, col=col)
+        if ref_line is not None:
+            add_line = fig.add_vline if horizontal else fig.add_hline
+            add_line(ref_line, line_dash="dash", line_color="#30363d", row=1, col=col)
+    fig.update_layout(LAYOUT_BASE, height=height, showlegend=False)
+    fig.update_xaxes(LAYOUT_BASE['xaxis'])
+    fig.update_yaxes(LAYOUT_BASE['yaxis'])
+    fig.update_traces(marker_line_width=0)
+    return fig.to_dict()
+
+# Conclusion tables as static HTML (no Arrow encoding or dataframe grid for a handful of
+# constant rows), keyed on the plain strings they display so a rerun skips building them
+@st.cache_data(show_spinner=False)
+def build_validation_html(prime_age_finding, h2_finding, h3_finding):
+    return pd.DataFrame({
+        "Hypothesis": ["H1: Prime Age", "H2: Hard-Track Masters", "H3: Reliability + Pace", "H4: Nationality"],
+        "Prediction": [
+            "Peak in mid-20s to early-30s",
+            "Best drivers excel on difficult circuits",
+            "Optimal = pace + reliability",
+            "Nationality is context, not destiny"
+        ],
+        "Finding": [
+            prime_age_finding,
+            h2_finding,
+            h3_finding,
+            "Argentine highest normalized, but style matters more"
+        ],
+        "Status": ["✅", "✅", "✅", "✅"]
+    }).to_html(index=False, border=0, classes="fb-table fb-validation")
+
+@st.cache_data(show_spinner=False)
+def build_profile_html():
+    return pd.DataFrame({
+        "Characteristic": [
+            "Prime Age",
+            "Points per Race", 
+            "Finish Rate",
+            "Racecraft",
+            "Hard Track Performance",
+            "Ideal Constructor"
+        ],
+        "Specification": [
+            "30-35 years",
+            "≥ 3.8",
+            "≥ 72%",
+            "Positive position delta",
+            "Minimal drop from easy circuits",
+            "'Tank with Teeth' (Mercedes-style)"
+        ]
+    }).to_html(index=False, border=0, classes="fb-table")
+
 # =============================================================================
 # NAVIGATION
 # =============================================================================
@@ -328,19 +764,15 @@ with tabs[0]:
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Key stats
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(create_metric_card(f"{len(df):,}", "Race Entries Analyzed"), unsafe_allow_html=True)
-    with col2:
-        st.markdown(create_metric_card(df["driver"].nunique(), "Unique Drivers"), unsafe_allow_html=True)
-    with col3:
-        st.markdown(create_metric_card(df["circuit_name"].nunique(), "Circuits"), unsafe_allow_html=True)
-    with col4:
-        years_span = df["year"].max() - df["year"].min()
-        st.markdown(create_metric_card(f"{years_span}+", "Years of History"), unsafe_allow_html=True)
+    years_span = df["year"].max() - df["year"].min()
+    st.markdown(create_metric_row(
+        create_metric_card(f"{len(df):,}", "Race Entries Analyzed"),
+        create_metric_card(df["driver"].nunique(), "Unique Drivers"),
+        create_metric_card(df["circuit_name"].nunique(), "Circuits"),
+        create_metric_card(f"{years_span}+", "Years of History"),
+    ), unsafe_allow_html=True)
     
-    st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
+    st.markdown(DIVIDER_HTML, unsafe_allow_html=True)
     
     # The Question
     st.markdown('<h2 class="section-header">The Question</h2>', unsafe_allow_html=True)
@@ -393,38 +825,16 @@ with tabs[1]:
         "How can we quantify the 'difficulty' of each circuit, and which circuits are historically the most punishing?"),
         unsafe_allow_html=True)
     
-    # Calculate circuit stats
-    circuit_stats = df.groupby("circuit_name").agg(
-        races=("race_name", "nunique"),
-        entries=("driver", "count"),
-        finishes=("finished", "sum")
-    )
-    circuit_stats["dnf_rate"] = 1 - circuit_stats["finishes"] / circuit_stats["entries"]
-    
-    # Difficulty tiers
-    q33, q66 = circuit_stats["dnf_rate"].quantile([0.33, 0.66])
-    circuit_stats["difficulty"] = circuit_stats["dnf_rate"].apply(
-        lambda x: "Easy" if x <= q33 else ("Medium" if x <= q66 else "Hard")
-    )
-    
     # Metrics
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        easy_count = (circuit_stats["difficulty"] == "Easy").sum()
-        st.markdown(create_metric_card(easy_count, "Easy Circuits", suffix=" 🟢"), unsafe_allow_html=True)
-    with col2:
-        medium_count = (circuit_stats["difficulty"] == "Medium").sum()
-        st.markdown(create_metric_card(medium_count, "Medium Circuits", suffix=" 🟡"), unsafe_allow_html=True)
-    with col3:
-        hard_count = (circuit_stats["difficulty"] == "Hard").sum()
-        st.markdown(create_metric_card(hard_count, "Hard Circuits", suffix=" 🔴"), unsafe_allow_html=True)
+    tier_counts = circuit_stats["difficulty"].value_counts()
+    st.markdown(create_metric_row(
+        create_metric_card(tier_counts["Easy"], "Easy Circuits", suffix=" 🟢"),
+        create_metric_card(tier_counts["Medium"], "Medium Circuits", suffix=" 🟡"),
+        create_metric_card(tier_counts["Hard"], "Hard Circuits", suffix=" 🔴"),
+    ), unsafe_allow_html=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
-    # Filter to circuits with ≥500 entries for statistical significance
-    # (matching methodology from earlier analysis)
-    big_circuits = circuit_stats[circuit_stats["entries"] >= 500].copy()
-    
     st.info(f"📊 Showing **{len(big_circuits)}** circuits with ≥500 entries for statistical significance")
     
     # Charts
@@ -432,68 +842,28 @@ with tabs[1]:
     
     with col1:
         st.markdown("### 🔴 Top 10 Hardest Circuits")
-        top_hard = big_circuits.nlargest(10, "dnf_rate").reset_index()
         
-        fig = px.bar(
-            top_hard.sort_values("dnf_rate"),
-            x="dnf_rate",
-            y="circuit_name",
-            orientation="h",
-            color="dnf_rate",
-            color_continuous_scale=["#ff6b35", "#ff1801"],
-        )
-        fig.update_layout(
-            **plotly_template['layout'],
-            height=400,
-            showlegend=False,
-            xaxis_title="DNF Rate",
-            yaxis_title="",
-            coloraxis_showscale=False,
-            xaxis_tickformat=".0%"
+        fig = build_dnf_rate_bar_fig(
+            tuple(top_hard["circuit_name"]), tuple(top_hard["dnf_rate"]), ("#ff6b35", "#ff1801")
         )
-        fig.update_traces(marker_line_width=0)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
     
     with col2:
         st.markdown("### 🟢 Top 10 Easiest Circuits")
-        top_easy = big_circuits.nsmallest(10, "dnf_rate").reset_index()
         
-        fig = px.bar(
-            top_easy.sort_values("dnf_rate", ascending=False),
-            x="dnf_rate",
-            y="circuit_name",
-            orientation="h",
-            color="dnf_rate",
-            color_continuous_scale=["#238636", "#3fb950"],
+        fig = build_dnf_rate_bar_fig(
+            tuple(top_easy["circuit_name"]), tuple(top_easy["dnf_rate"]), ("#238636", "#3fb950")
         )
-        fig.update_layout(
-            **plotly_template['layout'],
-            height=400,
-            showlegend=False,
-            xaxis_title="DNF Rate",
-            yaxis_title="",
-            coloraxis_showscale=False,
-            xaxis_tickformat=".0%"
-        )
-        fig.update_traces(marker_line_width=0)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
     
-    # Finding - use the filtered data for accurate stats
-    hardest = big_circuits.nlargest(1, "dnf_rate")
-    easiest = big_circuits.nsmallest(1, "dnf_rate")
+    # Finding - use the filtered data for accurate stats (extremes are the last bar of each chart)
+    hardest = top_hard.iloc[-1]
+    easiest = top_easy.iloc[-1]
     st.markdown(create_finding_box(
-        f"<b>{hardest.index[0]}</b> is the hardest circuit with <b>{hardest['dnf_rate'].iloc[0]:.0%}</b> DNF rate, "
-        f"while <b>{easiest.index[0]}</b> is easiest at <b>{easiest['dnf_rate'].iloc[0]:.0%}</b>. "
+        f"<b>{hardest['circuit_name']}</b> is the hardest circuit with <b>{hardest['dnf_rate']:.0%}</b> DNF rate, "
+        f"while <b>{easiest['circuit_name']}</b> is easiest at <b>{easiest['dnf_rate']:.0%}</b>. "
         f"The Final Boss must excel on <b>Hard circuits</b> where others struggle."
     ), unsafe_allow_html=True)
-    
-    # Add circuit difficulty to main df for later use
-    df = df.merge(
-        circuit_stats[["dnf_rate", "difficulty"]].reset_index(),
-        on="circuit_name",
-        how="left",
-        suffixes=('', '_circuit')
-    )
 
 # =============================================================================
 # TAB 3: DRIVER PERSONA (RQ2)
@@ -512,125 +882,34 @@ with tabs[2]:
     with rq2_tabs[0]:
         st.markdown("### When Do Drivers Peak?")
         
-        # Age bins
-        age_bins = [18, 22, 25, 30, 35, 40, 100]
-        age_labels = ["18–22", "22–25", "25–30", "30–35", "35–40", "40+"]
-        df["age_bin"] = pd.cut(df["age_years"], bins=age_bins, labels=age_labels, right=False)
-        
-        age_perf = df.groupby("age_bin", observed=True).agg(
-            races=("driver", "count"),
-            avg_points=("points", "mean"),
-            finish_rate=("finished", "mean"),
-            wins=("final_position", lambda x: (x == 1).sum())
-        ).reset_index()
-        age_perf["win_rate"] = age_perf["wins"] / age_perf["races"] * 100
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            fig = px.bar(
-                age_perf,
-                x="age_bin",
-                y="win_rate",
-                color="win_rate",
-                color_continuous_scale=["#30363d", "#ff1801"],
-                title="Win Rate by Age Group"
-            )
-            fig.update_layout(
-                **plotly_template['layout'],
-                height=350,
-                xaxis_title="Age Group",
-                yaxis_title="Win Rate (%)",
-                coloraxis_showscale=False
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        age_perf = analytics["age_perf"]
         
-        with col2:
-            fig = px.bar(
-                age_perf,
-                x="age_bin",
-                y="wins",
-                color="wins",
-                color_continuous_scale=["#30363d", "#ff6b35"],
-                title="Total Victories by Age Group"
-            )
-            fig.update_layout(
-                **plotly_template['layout'],
-                height=350,
-                xaxis_title="Age Group",
-                yaxis_title="Total Wins",
-                coloraxis_showscale=False
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        fig = go.Figure(build_bar_pair_fig(
+            age_perf["win_rate"], age_perf["wins"],
+            ("Win Rate by Age Group", "Total Victories by Age Group"),
+            ("Win Rate (%)", "Total Wins"),
+            (("#30363d", "#ff1801"), ("#30363d", "#ff6b35")),
+            orientation="v", label_title="Age Group", height=350
+        ))
+        st.plotly_chart(fig, use_container_width=True)
         
         # H1 Finding
-        prime_age = age_perf.loc[age_perf["win_rate"].idxmax()]
-        st.markdown(create_finding_box(
-            f"<b>H1 VALIDATED:</b> The prime performance window is <b>{prime_age['age_bin']}</b> with "
-            f"a <b>{prime_age['win_rate']:.1f}%</b> win rate and <b>{int(prime_age['wins'])}</b> total victories. "
-            f"This is when experience meets physical prime."
-        ), unsafe_allow_html=True)
+        st.markdown(create_finding_box(findings["H1"]), unsafe_allow_html=True)
     
     # --- PERFORMANCE METRICS ---
     with rq2_tabs[1]:
         st.markdown("### Driver Style Metrics")
         
-        # Driver summary
-        driver_summary = df.groupby("driver").agg(
-            races=("race_name", "count"),
-            points_per_race=("points", "mean"),
-            avg_position_delta=("position_delta", "mean"),
-            finish_rate=("finished", "mean"),
-            wins=("final_position", lambda x: (x == 1).sum())
-        ).reset_index()
-        driver_summary["win_rate"] = driver_summary["wins"] / driver_summary["races"]
-        
-        experienced = driver_summary[driver_summary["races"] >= 50].copy()
-        
-        col1, col2 = st.columns(2)
+        experienced = analytics["experienced"]
         
-        with col1:
-            st.markdown("#### 🏆 Top 10 by Points per Race")
-            top_ppr = experienced.nlargest(10, "points_per_race")
-            
-            fig = px.bar(
-                top_ppr.sort_values("points_per_race"),
-                x="points_per_race",
-                y="driver",
-                orientation="h",
-                color="points_per_race",
-                color_continuous_scale=["#ff6b35", "#ff1801"],
-            )
-            fig.update_layout(
-                **plotly_template['layout'],
-                height=400,
-                xaxis_title="Points per Race",
-                yaxis_title="",
-                coloraxis_showscale=False
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        
-        with col2:
-            st.markdown("#### 💪 Top 10 by Finish Rate")
-            top_finish = experienced.nlargest(10, "finish_rate")
-            
-            fig = px.bar(
-                top_finish.sort_values("finish_rate"),
-                x="finish_rate",
-                y="driver",
-                orientation="h",
-                color="finish_rate",
-                color_continuous_scale=["#238636", "#3fb950"],
-            )
-            fig.update_layout(
-                **plotly_template['layout'],
-                height=400,
-                xaxis_title="Finish Rate",
-                yaxis_title="",
-                coloraxis_showscale=False,
-                xaxis_tickformat=".0%"
-            )
-            st.plotly_chart(fig, use_container_width=True)
+        fig = go.Figure(build_bar_pair_fig(
+            analytics["top_ppr"]["points_per_race"], analytics["top_finish"]["finish_rate"],
+            ("🏆 Top 10 by Points per Race", "💪 Top 10 by Finish Rate"),
+            ("Points per Race", "Finish Rate"),
+            (("#ff6b35", "#ff1801"), ("#238636", "#3fb950")),
+            value_tickformats=(None, ".0%")
+        ))
+        st.plotly_chart(fig, use_container_width=True)
         
         # Scatter plot
         st.markdown("#### Driver Style Map: Consistency vs Racecraft")
@@ -641,13 +920,13 @@ with tabs[2]:
             y="avg_position_delta",
             size="points_per_race",
             color="points_per_race",
-            hover_name="driver",
+            hover_name=experienced.index,
             hover_data={"races": True, "wins": True},
             color_continuous_scale=["#30363d", "#ff1801"],
             size_max=30
         )
         fig.update_layout(
-            **plotly_template['layout'],
+            LAYOUT_SCATTER,
             height=500,
             xaxis_title="Finish Rate (Consistency)",
             yaxis_title="Avg Positions Gained (Racecraft)",
@@ -664,49 +943,15 @@ with tabs[2]:
     with rq2_tabs[2]:
         st.markdown("### Performance on Hard Circuits")
         
-        # Calculate performance by difficulty
-        driver_diff = df.groupby(["driver", "difficulty"]).agg(
-            races=("race_name", "count"),
-            ppr=("points", "mean")
-        ).reset_index()
-        
-        # Pivot
-        driver_pivot = driver_diff.pivot(index="driver", columns="difficulty", values="ppr").reset_index()
-        
-        # Filter drivers with enough races on both (10+ for statistical significance)
-        # This matches the notebook methodology
-        min_races_per_tier = 10
-        driver_races_diff = df.groupby(["driver", "difficulty"]).size().unstack(fill_value=0)
-        drivers_both = driver_races_diff[
-            (driver_races_diff.get("Easy", 0) >= min_races_per_tier) & 
-            (driver_races_diff.get("Hard", 0) >= min_races_per_tier)
-        ].index
-        
-        driver_easy_hard = driver_pivot[driver_pivot["driver"].isin(drivers_both)].dropna(subset=["Easy", "Hard"])
-        driver_easy_hard["hard_ratio"] = driver_easy_hard["Hard"] / driver_easy_hard["Easy"]
+        driver_easy_hard = analytics["driver_easy_hard"]
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("#### 🔥 Best on Hard Circuits (PPR)")
-            top_hard = driver_easy_hard.nlargest(10, "Hard")
+            top_hard_drivers = analytics["top_hard_drivers"]
             
-            fig = px.bar(
-                top_hard.sort_values("Hard"),
-                x="Hard",
-                y="driver",
-                orientation="h",
-                color="Hard",
-                color_continuous_scale=["#ff6b35", "#ff1801"],
-            )
-            fig.update_layout(
-                **plotly_template['layout'],
-                height=400,
-                xaxis_title="Points per Race (Hard Circuits)",
-                yaxis_title="",
-                coloraxis_showscale=False
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            top_bar_chart(top_hard_drivers["Hard"], "Points per Race (Hard Circuits)")
         
         with col2:
             st.markdown("#### 📊 Easy vs Hard Performance")
@@ -715,7 +960,7 @@ with tabs[2]:
                 driver_easy_hard,
                 x="Easy",
                 y="Hard",
-                hover_name="driver",
+                hover_name=driver_easy_hard.index,
                 color="hard_ratio",
                 color_continuous_scale=["#30363d", "#ff1801"],
                 size_max=12
@@ -729,8 +974,7 @@ with tabs[2]:
                 showlegend=False
             ))
             fig.update_layout(
-                **plotly_template['layout'],
-                height=400,
+                LAYOUT_SCATTER,
                 xaxis_title="PPR on Easy Circuits",
                 yaxis_title="PPR on Hard Circuits",
                 coloraxis_colorbar_title="Ratio"
@@ -742,36 +986,13 @@ with tabs[2]:
         st.markdown("<br>", unsafe_allow_html=True)
         st.markdown("#### 🏆 Hard Track Specialists (Hard/Easy PPR Ratio)")
         
-        # Filter to those with non-zero Easy PPR to avoid inf
-        valid_ratio = driver_easy_hard[driver_easy_hard["Easy"] > 0.1].copy()
-        top_specialists = valid_ratio.nlargest(10, "hard_ratio")
+        top_specialists = analytics["top_specialists"]
         
-        fig = px.bar(
-            top_specialists.sort_values("hard_ratio"),
-            x="hard_ratio",
-            y="driver",
-            orientation="h",
-            color="hard_ratio",
-            color_continuous_scale=["#ff6b35", "#ff1801"],
-        )
-        fig.update_layout(
-            **plotly_template['layout'],
-            height=350,
-            xaxis_title="Hard/Easy PPR Ratio",
-            yaxis_title="",
-            coloraxis_showscale=False
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        top_bar_chart(top_specialists["hard_ratio"], "Hard/Easy PPR Ratio", height=350)
         st.caption("Ratio > 1.0 means the driver performs BETTER on hard tracks than easy ones.")
         
         # H2 Finding
-        best_hard = driver_easy_hard.nlargest(1, "Hard").iloc[0]
-        drivers_above_90pct = driver_easy_hard[driver_easy_hard["hard_ratio"] >= 0.9]
-        st.markdown(create_finding_box(
-            f"<b>H2 VALIDATED:</b> <b>{best_hard['driver']}</b> leads hard circuit performance with "
-            f"<b>{best_hard['Hard']:.2f}</b> PPR. <b>{len(drivers_above_90pct)}</b> drivers maintain ≥90% of their "
-            f"easy-track performance on hard tracks. True legends don't just survive hard tracks, they maintain dominance."
-        ), unsafe_allow_html=True)
+        st.markdown(create_finding_box(findings["H2"]), unsafe_allow_html=True)
     
     # --- NATIONALITY ANALYSIS (H4) ---
     with rq2_tabs[3]:
@@ -787,61 +1008,18 @@ with tabs[2]:
         - This is more appropriate for the Final Boss analysis because it measures pure driver ability
         """)
         
-        # Calculate constructor PPR per season
-        constructor_season = df.groupby(["year", "constructor_name"]).agg(
-            constructor_points=("points", "sum"),
-            constructor_entries=("driver", "count")
-        )
-        constructor_season["constructor_ppr"] = (
-            constructor_season["constructor_points"] / constructor_season["constructor_entries"]
-        )
-        
-        # Merge back to df
-        df_nat = df.copy()
-        df_nat = df_nat.merge(
-            constructor_season[["constructor_ppr"]].reset_index(),
-            on=["year", "constructor_name"],
-            how="left"
-        )
-        
-        # Normalized points: driver points compared to their constructor's average
-        df_nat["normalized_points"] = df_nat["points"] / df_nat["constructor_ppr"].replace({0: np.nan})
-        
-        # Aggregate by nationality
-        nationality_summary = df_nat.groupby("driver_nationality").agg(
-            races=("race_name", "count"),
-            drivers=("driver", "nunique"),
-            avg_points=("points", "mean"),
-            avg_normalized_points=("normalized_points", "mean"),
-            finish_rate=("finished", "mean")
-        )
-        
-        # Filter to nationalities with 100+ races
-        nationality_filtered = nationality_summary[nationality_summary["races"] >= 100].copy()
-        nationality_filtered = nationality_filtered.sort_values("avg_normalized_points", ascending=False)
+        nationality_filtered = analytics["nationality_filtered"]
         
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("#### 🌍 Top Nationalities by Normalized Points")
-            top_nat = nationality_filtered.head(10).reset_index()
+            top_nat = nationality_filtered.head(10)
             
-            fig = px.bar(
-                top_nat.sort_values("avg_normalized_points"),
-                x="avg_normalized_points",
-                y="driver_nationality",
-                orientation="h",
-                color="avg_normalized_points",
-                color_continuous_scale=["#30363d", "#ff1801"],
-            )
-            fig.update_layout(
-                **plotly_template['layout'],
-                height=400,
-                xaxis_title="Avg Normalized Points (vs Constructor Avg)",
-                yaxis_title="",
-                coloraxis_showscale=False
-            )
-            fig.add_vline(x=1.0, line_dash="dash", line_color="#30363d")
+            fig = go.Figure(build_hbar_fig(
+                top_nat, "avg_normalized_points", ("#30363d", "#ff1801"),
+                "Avg Normalized Points (vs Constructor Avg)", vline=1.0
+            ))
             st.plotly_chart(fig, use_container_width=True)
             st.caption("Values > 1.0 = drivers extracting MORE than expected from their cars")
         
@@ -867,13 +1045,7 @@ with tabs[2]:
             )
         
         # H4 Finding
-        top_nationality = nationality_filtered.index[0]
-        top_norm = nationality_filtered.iloc[0]["avg_normalized_points"]
-        st.markdown(create_finding_box(
-            f"<b>H4 VALIDATED:</b> <b>{top_nationality}</b> drivers lead with <b>{top_norm:.2f}x</b> normalized points "
-            f"(extracting more than expected from their cars). However, nationality is <b>context, not destiny</b> – "
-            f"the Final Boss persona is defined by individual style metrics (racecraft, consistency, hard-track skill), not nationality alone."
-        ), unsafe_allow_html=True)
+        st.markdown(create_finding_box(findings["H4"]), unsafe_allow_html=True)
 
 # =============================================================================
 # TAB 4: CONSTRUCTOR PROFILE (RQ3)
@@ -885,20 +1057,10 @@ with tabs[3]:
         "Which constructor characteristics (pace, reliability, hard-track performance) best support a Final Boss?"),
         unsafe_allow_html=True)
     
-    # Constructor summary
-    constructor_summary = df.groupby("constructor_name").agg(
-        races=("race_name", "count"),
-        points_per_race=("points", "mean"),
-        finish_rate=("finished", "mean"),
-        mech_dnf_rate=("status_category", lambda x: (x == "Mechanical DNF").mean()),
-        wins=("final_position", lambda x: (x == 1).sum())
-    ).reset_index()
-    
-    major_constructors = constructor_summary[constructor_summary["races"] >= 100].copy()
-    major_constructors["tank_score"] = major_constructors["points_per_race"] * major_constructors["finish_rate"]
+    major_constructors = analytics["major_constructors"]
     
     # Top metrics
-    best = major_constructors.nlargest(1, "tank_score").iloc[0]
+    best = final_boss["best"]
     
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -914,24 +1076,9 @@ with tabs[3]:
     
     with col1:
         st.markdown("### 🏭 'Tank with Teeth' Score (PPR × Finish Rate)")
-        top_tank = major_constructors.nlargest(10, "tank_score")
+        top_tank = analytics["top_tank"]
         
-        fig = px.bar(
-            top_tank.sort_values("tank_score"),
-            x="tank_score",
-            y="constructor_name",
-            orientation="h",
-            color="tank_score",
-            color_continuous_scale=["#ff6b35", "#ff1801"],
-        )
-        fig.update_layout(
-            **plotly_template['layout'],
-            height=400,
-            xaxis_title="Tank with Teeth Score",
-            yaxis_title="",
-            coloraxis_showscale=False
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        top_bar_chart(top_tank["tank_score"], "Tank with Teeth Score")
     
     with col2:
         st.markdown("### 📊 Pace vs Reliability")
@@ -942,13 +1089,12 @@ with tabs[3]:
             y="points_per_race",
             size="races",
             color="mech_dnf_rate",
-            hover_name="constructor_name",
+            hover_name=major_constructors.index,
             color_continuous_scale=["#3fb950", "#ff1801"],
             size_max=40
         )
         fig.update_layout(
-            **plotly_template['layout'],
-            height=400,
+            LAYOUT_SCATTER,
             xaxis_title="Finish Rate (Reliability)",
             yaxis_title="Points per Race (Pace)",
             coloraxis_colorbar_title="Mech DNF %",
@@ -958,82 +1104,24 @@ with tabs[3]:
         st.caption("Color = Mechanical DNF rate (green = reliable, red = fragile). Size = total races.")
     
     # H3 Finding (part 1)
-    st.markdown(create_finding_box(
-        f"<b>H3 VALIDATED (Part 1):</b> <b>{best['constructor_name']}</b> is the ultimate 'Tank with Teeth' – "
-        f"combining <b>{best['points_per_race']:.2f}</b> PPR with <b>{best['finish_rate']:.0%}</b> finish rate "
-        f"and only <b>{best['mech_dnf_rate']:.1%}</b> mechanical DNFs. The Final Boss needs a car that finishes AND wins."
-    ), unsafe_allow_html=True)
+    st.markdown(create_finding_box(findings["H3_part1"]), unsafe_allow_html=True)
     
-    st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
+    st.markdown(DIVIDER_HTML, unsafe_allow_html=True)
     
     # Constructor Hard Circuit Performance
     st.markdown("### 🔥 Constructor Performance on Hard Circuits")
     
-    # Calculate constructor performance by difficulty
-    constructor_diff = df.groupby(["constructor_name", "difficulty"]).agg(
-        races=("race_name", "count"),
-        ppr=("points", "mean")
-    ).reset_index()
-    
-    # Pivot
-    constructor_pivot = constructor_diff.pivot(index="constructor_name", columns="difficulty", values="ppr").reset_index()
-    
-    # Filter constructors with enough races on both Easy and Hard
-    constructor_races_diff = df.groupby(["constructor_name", "difficulty"]).size().unstack(fill_value=0)
-    constructors_both = constructor_races_diff[
-        (constructor_races_diff.get("Easy", 0) >= 50) & 
-        (constructor_races_diff.get("Hard", 0) >= 50)
-    ].index
+    constructor_easy_hard = analytics["constructor_easy_hard"]
     
-    constructor_easy_hard = constructor_pivot[constructor_pivot["constructor_name"].isin(constructors_both)].copy()
-    constructor_easy_hard = constructor_easy_hard.dropna(subset=["Easy", "Hard"])
-    constructor_easy_hard["hard_specialist_score"] = constructor_easy_hard["Hard"] / constructor_easy_hard["Easy"]
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("#### ⭐ Top Constructors by Hard Circuit PPR")
-        top_hard_const = constructor_easy_hard.nlargest(10, "Hard")
-        
-        fig = px.bar(
-            top_hard_const.sort_values("Hard"),
-            x="Hard",
-            y="constructor_name",
-            orientation="h",
-            color="Hard",
-            color_continuous_scale=["#ff6b35", "#ff1801"],
-        )
-        fig.update_layout(
-            **plotly_template['layout'],
-            height=400,
-            xaxis_title="Points per Race (Hard Circuits)",
-            yaxis_title="",
-            coloraxis_showscale=False
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        st.markdown("#### 🏆 Hard Track Specialists (Hard/Easy Ratio)")
-        top_specialist_const = constructor_easy_hard.nlargest(10, "hard_specialist_score")
-        
-        fig = px.bar(
-            top_specialist_const.sort_values("hard_specialist_score"),
-            x="hard_specialist_score",
-            y="constructor_name",
-            orientation="h",
-            color="hard_specialist_score",
-            color_continuous_scale=["#30363d", "#ff1801"],
-        )
-        fig.update_layout(
-            **plotly_template['layout'],
-            height=400,
-            xaxis_title="Hard/Easy PPR Ratio",
-            yaxis_title="",
-            coloraxis_showscale=False
-        )
-        fig.add_vline(x=1.0, line_dash="dash", line_color="#30363d")
-        st.plotly_chart(fig, use_container_width=True)
-        st.caption("Ratio > 1.0 = constructor performs BETTER on hard circuits")
+    fig = go.Figure(build_bar_pair_fig(
+        analytics["top_hard_const"]["Hard"], analytics["top_specialist_const"]["hard_specialist_score"],
+        ("⭐ Top Constructors by Hard Circuit PPR", "🏆 Hard Track Specialists (Hard/Easy Ratio)"),
+        ("Points per Race (Hard Circuits)", "Hard/Easy PPR Ratio"),
+        (("#ff6b35", "#ff1801"), ("#30363d", "#ff1801")),
+        ref_lines=(None, 1.0)
+    ))
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption("Ratio > 1.0 (right panel) = constructor performs BETTER on hard circuits")
     
     # Constructor Easy vs Hard scatter
     st.markdown("#### 📊 Constructor Performance: Easy vs Hard Circuits")
@@ -1042,7 +1130,7 @@ with tabs[3]:
         constructor_easy_hard,
         x="Easy",
         y="Hard",
-        hover_name="constructor_name",
+        hover_name=constructor_easy_hard.index,
         color="hard_specialist_score",
         size_max=15,
         color_continuous_scale=["#30363d", "#ff1801"],
@@ -1055,8 +1143,7 @@ with tabs[3]:
         showlegend=False
     ))
     fig.update_layout(
-        **plotly_template['layout'],
-        height=400,
+        LAYOUT_SCATTER,
         xaxis_title="PPR on Easy Circuits",
         yaxis_title="PPR on Hard Circuits",
         coloraxis_colorbar_title="Ratio"
@@ -1064,12 +1151,7 @@ with tabs[3]:
     st.plotly_chart(fig, use_container_width=True)
     
     # H3 Finding (part 2)
-    best_hard_constructor = constructor_easy_hard.nlargest(1, "Hard").iloc[0]
-    st.markdown(create_finding_box(
-        f"<b>H3 VALIDATED (Part 2):</b> <b>{best_hard_constructor['constructor_name']}</b> leads on hard circuits with "
-        f"<b>{best_hard_constructor['Hard']:.2f}</b> PPR. The best constructors balance pace with reliability, "
-        f"especially maintaining performance on difficult circuits."
-    ), unsafe_allow_html=True)
+    st.markdown(create_finding_box(findings["H3_part2"]), unsafe_allow_html=True)
 
 # =============================================================================
 # TAB 5: FINAL BOSS CANDIDATES (RQ4)
@@ -1081,61 +1163,18 @@ with tabs[4]:
         "When we combine all patterns, what does our F1 Final Boss specification look like?"),
         unsafe_allow_html=True)
     
-    # Prepare data - use same methodology as notebook (10+ races on Hard circuits)
-    min_races_per_tier = 10
-    
-    # Calculate hard track PPR for drivers with enough races
-    driver_diff = df.groupby(["driver", "difficulty"]).agg(
-        races=("race_name", "count"),
-        ppr=("points", "mean")
-    ).reset_index()
-    
-    # Filter to drivers with 10+ races on Hard circuits
-    driver_hard = driver_diff[(driver_diff["difficulty"] == "Hard") & (driver_diff["races"] >= min_races_per_tier)]
-    
-    # Merge with driver_summary
-    if "ppr_hard" in driver_summary.columns:
-        driver_summary = driver_summary.drop(columns=["ppr_hard"])
-    
-    driver_summary = driver_summary.merge(
-        driver_hard[["driver", "ppr"]].rename(columns={"ppr": "ppr_hard"}),
-        on="driver",
-        how="left"
-    )
-    
-    # Filter candidates: 50+ races AND has valid hard track PPR
-    candidates = driver_summary[
-        (driver_summary["races"] >= 50) & 
-        (driver_summary["ppr_hard"].notna())
-    ].copy()
-    
-    # Normalize and score
-    def normalize(s):
-        return (s - s.min()) / (s.max() - s.min() + 1e-10)
-    
-    candidates["norm_ppr"] = normalize(candidates["points_per_race"])
-    candidates["norm_finish"] = normalize(candidates["finish_rate"])
-    candidates["norm_delta"] = normalize(candidates["avg_position_delta"])
-    candidates["norm_hard"] = normalize(candidates["ppr_hard"])
-    
-    candidates["final_boss_score"] = (
-        candidates["norm_ppr"] * 0.30 +
-        candidates["norm_finish"] * 0.20 +
-        candidates["norm_delta"] * 0.20 +
-        candidates["norm_hard"] * 0.30
-    )
-    
-    top_15 = candidates.nlargest(15, "final_boss_score")
+    top_15 = analytics["top_15"]
     
     # Winner
-    winner = top_15.iloc[0]
+    winner = final_boss["winner"]
+    winner_text = final_boss["winner_text"]
     
     # Hero card for winner
     st.markdown(f"""
     <div class="driver-card">
         <p style="color: #8b949e; margin-bottom: 10px; letter-spacing: 0.2em; font-size: 0.85rem;">THE F1 FINAL BOSS</p>
         <p class="driver-name">{winner['driver']}</p>
-        <p class="driver-score">{winner['final_boss_score']:.3f}</p>
+        <p class="driver-score">{winner_text['final_boss_score']}</p>
         <p style="color: #8b949e; margin-top: 10px;">Final Boss Score</p>
     </div>
     """, unsafe_allow_html=True)
@@ -1145,35 +1184,23 @@ with tabs[4]:
     # Winner stats
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.markdown(create_metric_card(int(winner["races"]), "Career Races"), unsafe_allow_html=True)
+        st.markdown(create_metric_card(winner_text["races"], "Career Races"), unsafe_allow_html=True)
     with col2:
-        st.markdown(create_metric_card(f"{winner['points_per_race']:.2f}", "Points per Race"), unsafe_allow_html=True)
+        st.markdown(create_metric_card(winner_text["points_per_race"], "Points per Race"), unsafe_allow_html=True)
     with col3:
-        st.markdown(create_metric_card(f"{winner['finish_rate']:.0%}", "Finish Rate"), unsafe_allow_html=True)
+        st.markdown(create_metric_card(winner_text["finish_rate"], "Finish Rate"), unsafe_allow_html=True)
     with col4:
-        st.markdown(create_metric_card(f"+{winner['avg_position_delta']:.1f}", "Avg Positions Gained"), unsafe_allow_html=True)
+        st.markdown(create_metric_card(winner_text["avg_position_delta"], "Avg Positions Gained"), unsafe_allow_html=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Top 15 chart
     st.markdown("### 🏆 Top 15 Final Boss Candidates")
     
-    fig = px.bar(
-        top_15.sort_values("final_boss_score"),
-        x="final_boss_score",
-        y="driver",
-        orientation="h",
-        color="final_boss_score",
-        color_continuous_scale=["#30363d", "#ff6b35", "#ff1801"],
-        hover_data=["races", "points_per_race", "finish_rate"]
-    )
-    fig.update_layout(
-        **plotly_template['layout'],
-        height=500,
-        xaxis_title="Final Boss Score",
-        yaxis_title="",
-        coloraxis_showscale=False
-    )
+    fig = go.Figure(build_hbar_fig(
+        top_15, "final_boss_score", ("#30363d", "#ff6b35", "#ff1801"), "Final Boss Score",
+        height=500, hover_data=("races", "points_per_race", "finish_rate")
+    ))
     st.plotly_chart(fig, use_container_width=True)
     
     # Score breakdown
@@ -1189,12 +1216,11 @@ with tabs[4]:
 # =============================================================================
 # TAB 6: CONCLUSION
 # =============================================================================
-with tabs[5]:
-    st.markdown('<h2 class="section-header">Conclusion: The Final Boss Specification</h2>', unsafe_allow_html=True)
-    
-    # Hypothesis validation
-    st.markdown("### ✅ Hypothesis Validation")
-    
+# Rendered as a fragment so reruns triggered from inside the tab stay scoped to it.
+# The whole tab is four writes: two st.markdown blocks for the headers, validation table
+# and insight, and two st.html blocks for the profile grid and the runner-ups + footer.
+@st.fragment
+def render_conclusion(winner, winner_text, best, runner_ups):
     # Get dynamic values for validation table
     # H1: Get prime age from age analysis
     prime_age_finding = "30-35 years has highest win rate"
@@ -1205,109 +1231,43 @@ with tabs[5]:
     # H3: Get best constructor
     h3_finding = f"{best['constructor_name']}: {best['points_per_race']:.1f} PPR + {best['finish_rate']:.0%} finish"
     
-    validation_data = pd.DataFrame({
-        "Hypothesis": ["H1: Prime Age", "H2: Hard-Track Masters", "H3: Reliability + Pace", "H4: Nationality"],
-        "Prediction": [
-            "Peak in mid-20s to early-30s",
-            "Best drivers excel on difficult circuits",
-            "Optimal = pace + reliability",
-            "Nationality is context, not destiny"
-        ],
-        "Finding": [
-            prime_age_finding,
-            h2_finding,
-            h3_finding,
-            "Argentine highest normalized, but style matters more"
-        ],
-        "Status": ["✅", "✅", "✅", "✅"]
-    })
-    
-    st.dataframe(
-        validation_data,
-        hide_index=True,
-        use_container_width=True,
-        column_config={
-            "Status": st.column_config.TextColumn(width="small")
-        }
+    # Hypothesis validation table, then the profile header. Joined with explicit blank
+    # lines rather than an indented block, since the table HTML starts at column 0.
+    st.markdown(
+        '<h2 class="section-header">Conclusion: The Final Boss Specification</h2>\n\n'
+        "### ✅ Hypothesis Validation\n\n"
+        + build_validation_html(prime_age_finding, h2_finding, h3_finding)
+        + f"\n\n{DIVIDER_HTML}\n\n"
+        "### 🏁 The F1 Final Boss Profile",
+        unsafe_allow_html=True
     )
     
-    st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
-    
-    # Final Boss Profile
-    st.markdown("### 🏁 The F1 Final Boss Profile")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        profile_data = pd.DataFrame({
-            "Characteristic": [
-                "Prime Age",
-                "Points per Race", 
-                "Finish Rate",
-                "Racecraft",
-                "Hard Track Performance",
-                "Ideal Constructor"
-            ],
-            "Specification": [
-                "30-35 years",
-                "≥ 3.8",
-                "≥ 72%",
-                "Positive position delta",
-                "Minimal drop from easy circuits",
-                "'Tank with Teeth' (Mercedes-style)"
-            ]
-        })
-        st.dataframe(profile_data, hide_index=True, use_container_width=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class="driver-card" style="padding: 20px;">
-            <p style="color: #8b949e; letter-spacing: 0.15em; font-size: 0.8rem;">CLOSEST MATCH</p>
-            <p class="driver-name" style="font-size: 1.8rem;">{winner['driver']}</p>
-            <p style="color: #e6edf3; margin-top: 15px; line-height: 1.6;">
-                <b>{int(winner['races'])}</b> races of experience<br>
-                <b>{winner['points_per_race']:.2f}</b> points per race<br>
-                <b>{winner['finish_rate']:.0%}</b> finish rate<br>
-                <b>+{winner['avg_position_delta']:.1f}</b> positions gained/race
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    st.markdown("<hr class='section-divider'>", unsafe_allow_html=True)
-    
-    # Key insight
-    st.markdown("### 💡 Key Insight")
-    
-    st.markdown("""
-    <div class="rq-box" style="border-color: #ff1801;">
-        <p style="color: #e6edf3; font-size: 1.2rem; line-height: 1.8; margin: 0;">
-            The F1 Final Boss is not the fastest qualifier or the most spectacular overtaker – 
-            they are the <span class="f1-red"><b>complete package</b></span>: experienced enough to read races tactically, 
-            consistent enough to bring the car home, skilled enough to gain positions when needed, 
-            and mentally tough enough to thrive when conditions punish others.
-        </p>
-        <p style="color: #ff1801; font-size: 1.3rem; font-style: italic; margin-top: 20px; margin-bottom: 0;">
-            "When others struggle, the Final Boss excels."
+    # Profile table and closest-match card as one two-column grid (a single element, no
+    # st.columns blocks)
+    card_html = f"""
+    <div class="driver-card" style="padding: 20px;">
+        <p style="color: #8b949e; letter-spacing: 0.15em; font-size: 0.8rem;">CLOSEST MATCH</p>
+        <p class="driver-name" style="font-size: 1.8rem;">{winner['driver']}</p>
+        <p style="color: #e6edf3; margin-top: 15px; line-height: 1.6;">
+            <b>{winner_text['races']}</b> races of experience<br>
+            <b>{winner_text['points_per_race']}</b> points per race<br>
+            <b>{winner_text['finish_rate']}</b> finish rate<br>
+            <b>{winner_text['avg_position_delta']}</b> positions gained/race
         </p>
     </div>
-    """, unsafe_allow_html=True)
+    """
+    st.html(f'<div class="profile-grid">{build_profile_html()}{card_html}</div>')
     
-    st.markdown("<br><br>", unsafe_allow_html=True)
-    
-    # Runner ups
-    st.markdown("### 🥈 Runner-ups")
-    
-    runner_ups = top_15.iloc[1:6]
-    cols = st.columns(5)
-    for i, (idx, driver) in enumerate(runner_ups.iterrows()):
-        with cols[i]:
-            st.markdown(f"""
-            <div style="text-align: center; padding: 15px; background: #21262d; border-radius: 12px; border: 1px solid #30363d;">
-                <p style="color: #8b949e; font-size: 0.75rem; margin: 0;">#{i+2}</p>
-                <p style="color: #e6edf3; font-weight: 600; margin: 5px 0;">{driver['driver']}</p>
-                <p style="color: #ff1801; font-weight: 700; margin: 0;">{driver['final_boss_score']:.3f}</p>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    st.markdown("<br><br>", unsafe_allow_html=True)
-    st.markdown("<p style='text-align: center; color: #8b949e;'>Thank you for watching! 🏎️</p>", unsafe_allow_html=True)
+    # Key insight, then the runner-ups header
+    st.markdown(
+        f"{DIVIDER_HTML}\n\n### 💡 Key Insight\n\n{INSIGHT_HTML}\n\n<br><br>\n\n### 🥈 Runner-ups",
+        unsafe_allow_html=True
+    )
+    
+    # Runner-up grid and footer in one write
+    st.html(create_runner_up_row(runner_ups) + FOOTER_HTML)
+
+with tabs[5]:
+    render_conclusion(
+        final_boss["winner"], final_boss["winner_text"], final_boss["best"], final_boss["runner_ups"]
+    )